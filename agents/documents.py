@@ -0,0 +1,82 @@
+import os
+from pydantic import BaseModel
+from typing import Optional
+
+# =========================
+#  Pydantic Models (Match the Frontend)
+# =========================
+
+class Posting(BaseModel):
+    ID: int
+    title: str
+    company: str
+    location: Optional[str] = None
+    about: Optional[str] = None
+    job_description: Optional[str] = None
+    responsibilities: Optional[str] = None
+    qualifications: Optional[str] = None
+
+class Profile(BaseModel):
+    ID: int
+    Name: str
+    Profile: Optional[str] = None
+    experience: Optional[str] = None
+    education: Optional[str] = None
+    skills: Optional[str] = None
+    extracurricular: Optional[str] = None
+    preferences: Optional[str] = None
+
+# =========================
+#  Data File Handling
+# =========================
+
+# Shared by the API and batch_runner.py, so the two must never run at the same time
+POSTINGS_DIR = "data/postings"
+PROFILES_DIR = "data/profiles"
+
+def clear_data_folder(directory: str):
+    """Remove all .txt files from one data directory."""
+    os.makedirs(directory, exist_ok=True)
+    for filename in os.listdir(directory):
+        if filename.endswith(".txt"):
+            os.remove(os.path.join(directory, filename))
+
+def write_posting_file(p: Posting, filename: Optional[str] = None):
+    """Write one posting into its .txt file (named after the title by default)."""
+    filepath = os.path.join(POSTINGS_DIR, filename or f"{p.title}.txt")
+    content = f"""
+JOB TITLE: {p.title}
+COMPANY: {p.company}
+LOCATION: {p.location or ''}
+ABOUT US:
+{p.about or ''}
+JOB DESCRIPTION:
+{p.job_description or ''}
+RESPONSIBILITIES:
+{p.responsibilities or ''}
+QUALIFICATIONS:
+{p.qualifications or ''}
+"""
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(content)
+
+def write_profile_file(p: Profile, filename: Optional[str] = None):
+    """Write one profile into its .txt file (named after the name by default)."""
+    filepath = os.path.join(PROFILES_DIR, filename or f"{p.Name}.txt")
+    content = f"""
+NAME: {p.Name}
+PROFILE:
+{p.Profile or ''}
+EXPERIENCE:
+{p.experience or ''}
+EDUCATION:
+{p.education or ''}
+SKILLS:
+{p.skills or ''}
+EXTRACURRICULARS:
+{p.extracurricular or ''}
+PREFERENCES:
+{p.preferences or ''}
+"""
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(content)
@@ -0,0 +1,183 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing
+from typing import Any, List, Optional, Tuple
+
+# --- 1. Setup ---
+# When set, the API publishes matchmaking work to this queue instead of running it in-process
+QUEUE_PATH_ENV = "MATCHMAKING_QUEUE_PATH"
+DEFAULT_QUEUE_PATH = "data/jobs.sqlite3"
+# How long a run waits for workers before giving up (e.g. none are running)
+QUEUE_TIMEOUT_ENV = "MATCHMAKING_QUEUE_TIMEOUT_SECONDS"
+DEFAULT_QUEUE_TIMEOUT_SECONDS = 600.0
+
+# --- 2. Queue Interface ---
+class JobQueue(ABC):
+    """
+    Interface for queues that hand matchmaking work units to worker processes.
+    Each job is a (kind, payload) pair; see JOB_HANDLERS in matcher_agent.
+    """
+
+    @abstractmethod
+    def enqueue(self, kind: str, payload: dict) -> str:
+        """Publishes a job and returns its id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim(self) -> Optional[Tuple[str, str, dict]]:
+        """Takes the next pending job as (job_id, kind, payload), or None if the queue is empty."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Any) -> None:
+        """Stores the result of a finished job."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> None:
+        """Marks a job as failed with an error message."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait_for_results(self, job_ids: List[str], timeout: Optional[float] = None) -> List[Any]:
+        """Blocks until every job has finished and returns the results in the same order."""
+        raise NotImplementedError
+
+# --- 3. SQLite Implementation ---
+class SQLiteJobQueue(JobQueue):
+    """
+    Local queue backed by a single SQLite file. Safe to share between the
+    API process and any number of worker processes on the same machine.
+    """
+
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH, lease_seconds: float = 600.0, poll_interval: float = 0.5):
+        self.path = path
+        # Running jobs older than this are handed out again (e.g. after a worker crash)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    claimed_at REAL
+                )
+            """)
+
+    def _connect(self):
+        # Autocommit mode so claim() can manage its own write transaction
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def enqueue(self, kind: str, payload: dict) -> str:
+        job_id = uuid.uuid4().hex
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, payload, created_at) VALUES (?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), time.time()),
+            )
+        return job_id
+
+    def claim(self) -> Optional[Tuple[str, str, dict]]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock, so two workers can't claim the same job
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                """
+                SELECT id, kind, payload FROM jobs
+                WHERE status = 'pending' OR (status = 'running' AND claimed_at < ?)
+                ORDER BY created_at LIMIT 1
+                """,
+                (now - self.lease_seconds,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', claimed_at = ? WHERE id = ?",
+                (now, row[0]),
+            )
+            conn.execute("COMMIT")
+            return row[0], row[1], json.loads(row[2])
+        except Exception:
+            # BEGIN IMMEDIATE may have timed out, in which case there is nothing to roll back
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def complete(self, job_id: str, result: Any) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'done', result = ? WHERE id = ?",
+                (json.dumps(result), job_id),
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ? WHERE id = ?",
+                (error, job_id),
+            )
+
+    def wait_for_results(self, job_ids: List[str], timeout: Optional[float] = None) -> List[Any]:
+        if not job_ids:
+            return []
+        deadline = time.time() + timeout if timeout is not None else None
+        placeholders = ",".join("?" for _ in job_ids)
+        while True:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT id, status, result, error FROM jobs WHERE id IN ({placeholders})",
+                    job_ids,
+                ).fetchall()
+            finished = {row[0]: row for row in rows if row[1] in ("done", "failed")}
+            if len(finished) == len(job_ids):
+                break
+            if deadline is not None and time.time() > deadline:
+                # Nobody is waiting for these anymore, so don't leave them for the workers
+                with closing(self._connect()) as conn:
+                    conn.execute(f"DELETE FROM jobs WHERE id IN ({placeholders})", job_ids)
+                raise TimeoutError(f"{len(job_ids) - len(finished)} job(s) did not finish in {timeout}s")
+            time.sleep(self.poll_interval)
+
+        # Results have been collected, so the rows are no longer needed
+        with closing(self._connect()) as conn:
+            conn.execute(f"DELETE FROM jobs WHERE id IN ({placeholders})", job_ids)
+
+        results = []
+        for job_id in job_ids:
+            _, status, result, error = finished[job_id]
+            if status == "failed":
+                raise RuntimeError(f"Job {job_id} failed: {error}")
+            results.append(json.loads(result))
+        return results
+
+# --- 4. Factory ---
+def get_job_queue() -> Optional[JobQueue]:
+    """
+    Returns the configured queue, or None to run matchmaking in-process.
+    """
+    path = os.getenv(QUEUE_PATH_ENV)
+    if not path:
+        return None
+    return SQLiteJobQueue(path)
+
+def get_queue_timeout() -> float:
+    """
+    Returns how many seconds to wait for queued jobs before giving up.
+    """
+    return float(os.getenv(QUEUE_TIMEOUT_ENV, DEFAULT_QUEUE_TIMEOUT_SECONDS))
@@ -4,14 +4,132 @@ import ast  # For safely evaluating the LLM's list-as-a-string output
 from .profile_agent import get_profile_agent_graph
 from .recruiter_agent import get_recruiter_agent_graph
 from .judge_agent import get_judge_agent_graph
+from .summary_agent import summarize_file
+from .job_queue import get_queue_timeout
 # -----------------------
 
+# Compiled graphs are reused across work units in the same process
+_agent_graphs = {}
+
+def get_agent_graph(name: str):
+    """
+    Compiles an agent graph on first use and returns the cached copy afterwards.
+    """
+    if name not in _agent_graphs:
+        builders = {
+            "profile": get_profile_agent_graph,
+            "recruiter": get_recruiter_agent_graph,
+            "judge": get_judge_agent_graph,
+        }
+        _agent_graphs[name] = builders[name]()
+    return _agent_graphs[name]
+
+def parse_filename_list(raw: str) -> list:
+    """
+    Turns the LLM's list-as-a-string output into a plain list of filenames.
+    Anything that isn't a list/tuple/set of strings raises ValueError, so the
+    result is always JSON-safe and the same with or without a queue.
+    """
+    # The LLM gives us a string "['file1.txt']", ast.literal_eval turns it into a real value
+    parsed = ast.literal_eval(raw)
+    if not isinstance(parsed, (list, tuple, set)) or not all(isinstance(f, str) for f in parsed):
+        raise ValueError(f"Expected a list of filenames, got {type(parsed).__name__}")
+    return list(parsed)
+
+# =========================
+#  Work Units
+# =========================
+
+def run_summary_job(directory: str, filename: str, kind: str) -> bool:
+    """
+    Creates (or finds) the cached digest for one document, so the scanners
+    only have to read it from the cache.
+    """
+    summarize_file(directory, filename, kind)
+    return True
+
+def run_recruiter_job(posting_file: str) -> list:
+    """
+    Runs the recruiter agent for one posting and returns its picked profile files.
+    """
+    print(f"Recruiter is analyzing: {posting_file}")
+
+    # Run the recruiter graph
+    recruiter_state = get_agent_graph("recruiter").invoke({"target_posting_filename": posting_file})
+    recruiter_picks_str = recruiter_state["messages"][-1].content
+
+    try:
+        recruiter_picks_list = parse_filename_list(recruiter_picks_str)
+        print(f"  [Recruiter Agent Debug]: LLM returned list: {recruiter_picks_list}")
+    except Exception:
+        print(f"  Warning: Recruiter LLM returned bad format for {posting_file}. Skipping.")
+        recruiter_picks_list = []
+    return recruiter_picks_list
+
+def run_profile_job(profile_file: str) -> list:
+    """
+    Runs the profile agent for one profile and returns the posting files it liked.
+    """
+    print(f"Profile agent is analyzing: {profile_file}")
+
+    # Run the profile graph
+    profile_state = get_agent_graph("profile").invoke({"target_profile_filename": profile_file})
+    profile_picks_str = profile_state["messages"][-1].content
+
+    try:
+        profile_picks_list = parse_filename_list(profile_picks_str)
+        print(f"  [Profile Agent Debug]: LLM returned list: {profile_picks_list}")
+    except Exception:
+        print(f"  Warning: Profile LLM returned bad format for {profile_file}. Skipping.")
+        profile_picks_list = []
+    return profile_picks_list
+
+def run_judge_job(posting_file: str, recruiter_picks: list, interested_profiles: list) -> str:
+    """
+    Runs the judge agent for one posting and returns the full verdict text.
+    """
+    judge_input = {
+        "target_posting_filename": posting_file,
+        "recruiter_picks_list": recruiter_picks,
+        "interested_profiles_list": interested_profiles
+    }
+
+    # Run the judge graph
+    judge_state = get_agent_graph("judge").invoke(judge_input)
+    return judge_state["messages"][-1].content
+
+# Maps a queued job's kind to the function that executes it (payload = keyword arguments)
+JOB_HANDLERS = {
+    "summary": run_summary_job,
+    "recruiter": run_recruiter_job,
+    "profile": run_profile_job,
+    "judge": run_judge_job,
+}
+
+def run_job(kind: str, payload: dict):
+    """
+    Executes a single work unit. Used both in-process and by queue workers.
+    """
+    return JOB_HANDLERS[kind](**payload)
+
+def run_jobs(jobs: list, job_queue=None) -> list:
+    """
+    Runs a list of (kind, payload) jobs and returns their results in order.
+    Without a queue the jobs run here; with one they are published and
+    this call waits for the workers to finish them, up to the queue timeout.
+    """
+    if job_queue is None:
+        return [run_job(kind, payload) for kind, payload in jobs]
+    job_ids = [job_queue.enqueue(kind, payload) for kind, payload in jobs]
+    return job_queue.wait_for_results(job_ids, timeout=get_queue_timeout())
+
 # --- This is the main function your API server will call ---
-def run_full_matchmaking():
+def run_full_matchmaking(job_queue=None):
     """
     Runs the entire matchmaking process and returns a dictionary of verdicts.
+    Pass a JobQueue to spread the agent work over worker processes.
     """
-    
+
     # --- 1. Get all files ---
     try:
         all_posting_files = [f for f in os.listdir("data/postings") if f.endswith('.txt')]
@@ -22,86 +140,57 @@ def run_full_matchmaking():
 
     print(f"Found {len(all_posting_files)} postings and {len(all_profile_files)} profiles.")
 
-    # --- 2. Compile all agent graphs ---
-    profile_agent = get_profile_agent_graph()
-    recruiter_agent = get_recruiter_agent_graph()
-    judge_agent = get_judge_agent_graph()
+    # --- 2. Summarize EACH posting and profile once, before any agent reads them ---
+    print("\n--- Summarizing Documents ---")
+    summary_jobs = [("summary", {"directory": "data/postings", "filename": f, "kind": "job posting"}) for f in all_posting_files]
+    summary_jobs += [("summary", {"directory": "data/profiles", "filename": f, "kind": "candidate profile"}) for f in all_profile_files]
+    run_jobs(summary_jobs, job_queue)
+
+    # --- 3. Run Recruiter Agent for EACH posting and Profile Agent for EACH profile ---
+    # These don't depend on each other, so they are submitted as one batch
+    print("\n--- Running Recruiter and Profile Agents ---")
+    jobs = [("recruiter", {"posting_file": f}) for f in all_posting_files]
+    jobs += [("profile", {"profile_file": f}) for f in all_profile_files]
+    results = run_jobs(jobs, job_queue)
+    recruiter_results = results[:len(all_posting_files)]
+    profile_results = results[len(all_posting_files):]
 
     # This dictionary will hold all the "session lists"
     match_database = {}
 
-    # --- 3. Run Recruiter Agent for EACH posting ---
-    print("\n--- Running Recruiter Agents ---")
-    for posting_file in all_posting_files:
-        print(f"Recruiter is analyzing: {posting_file}")
-        
-        # The input state for the recruiter
-        recruiter_input = {"target_posting_filename": posting_file}
-        
-        # Run the recruiter graph
-        recruiter_state = recruiter_agent.invoke(recruiter_input)
-        recruiter_picks_str = recruiter_state["messages"][-1].content
-        
-        try:
-            # The LLM gives us a string "['file1.txt']", ast.literal_eval turns it into a real list
-            recruiter_picks_list = ast.literal_eval(recruiter_picks_str)
-            print(f"  [Recruiter Agent Debug]: LLM returned list: {recruiter_picks_list}")
-        except Exception:
-            print(f"  Warning: Recruiter LLM returned bad format for {posting_file}. Skipping.")
-            recruiter_picks_list = []
-
-        # Store the recruiter's picks in our database
+    # --- 4. Store the recruiter's picks in our database ---
+    for posting_file, recruiter_picks_list in zip(all_posting_files, recruiter_results):
         match_database[posting_file] = {
             "recruiter_picks": recruiter_picks_list,
             "interested_profiles": []  # Initialize empty list for profiles
         }
 
-    # --- 4. Run Profile Agent for EACH profile ---
-    print("\n--- Running Profile Agents ---")
-    for profile_file in all_profile_files:
-        print(f"Profile agent is analyzing: {profile_file}")
-        
-        # The input state for the profile agent
-        profile_input = {"target_profile_filename": profile_file}
-        
-        # Run the profile graph
-        profile_state = profile_agent.invoke(profile_input)
-        profile_picks_str = profile_state["messages"][-1].content
-
-        try:
-            profile_picks_list = ast.literal_eval(profile_picks_str)
-            print(f"  [Profile Agent Debug]: LLM returned list: {profile_picks_list}")
-        except Exception:
-            print(f"  Warning: Profile LLM returned bad format for {profile_file}. Skipping.")
-            profile_picks_list = []
-
-        # Add this profile to the "interested_profiles" list for each job it liked
+    # --- 5. Add each profile to the "interested_profiles" list for each job it liked ---
+    for profile_file, profile_picks_list in zip(all_profile_files, profile_results):
         for posting_file in profile_picks_list:
             if posting_file in match_database:
                 match_database[posting_file]["interested_profiles"].append(profile_file)
             else:
                 print(f"  Warning: Profile agent for {profile_file} liked a non-existent job: {posting_file}")
 
-    # --- 5. Run Judge Agent (Optional: Only for collecting mutual matches) ---
+    # --- 6. Run Judge Agent (Optional: Only for collecting mutual matches) ---
     print("\n--- Running Judge Agents ---")
-    
+    # Note: We still run the judge agent, but we are primarily interested
+    # in the 'mutual_matches' we calculated before the judge runs.
+    judge_jobs = [
+        ("judge", {
+            "posting_file": posting_file,
+            "recruiter_picks": data["recruiter_picks"],
+            "interested_profiles": data["interested_profiles"],
+        })
+        for posting_file, data in match_database.items()
+    ]
+    run_jobs(judge_jobs, job_queue)  # Verdicts are kept for completeness only
+
     # Initialize the list to store only the final mutual matches
     final_match_list = []
 
     for posting_file, data in match_database.items():
-        # --- Run the Judge Agent to get the final verdict (if needed) ---
-        # Note: We still run the judge agent, but we are primarily interested
-        # in the 'mutual_matches' we calculated before the judge runs.
-        judge_input = {
-            "target_posting_filename": posting_file,
-            "recruiter_picks_list": data["recruiter_picks"],
-            "interested_profiles_list": data["interested_profiles"]
-        }
-
-        # Run the judge graph
-        judge_state = judge_agent.invoke(judge_input)
-        verdict = judge_state["messages"][-1].content # Keep the full verdict for completeness
-
         # Calculate the mutual matches
         mutual_matches = list(set(data["recruiter_picks"]) & set(data["interested_profiles"]))
 
@@ -114,7 +203,7 @@ def run_full_matchmaking():
 
 
     print("\n--- Matchmaking complete. ---")
-    
+
     # --- RETURN THE SIMPLIFIED LIST ---
     print(final_match_list)
-    return final_match_list
\ No newline at end of file
+    return final_match_list
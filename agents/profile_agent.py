@@ -5,6 +5,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from typing_extensions import TypedDict
 from langchain_google_genai import ChatGoogleGenerativeAI
+from .summary_agent import summarize_document, summarize_file
 
 # --- 1. Setup ---
 load_dotenv()
@@ -47,18 +48,18 @@ def scanner_node(state: State):
     else:
         return {"messages": [("system", "Error: No profile_text or target_profile_filename provided.")]}
 
-    # --- This part is the same as before ---
-    
-    # Scan and load ALL job postings
+    # Only the condensed digest goes into the multi-posting prompt
+    profile_text = summarize_document(profile_text, "candidate profile")
+
+    # Scan and load ALL job postings (as cached digests)
     try:
         posting_files = os.listdir("data/postings")
         all_postings_text = ""
         for filename in posting_files:
             if filename.endswith(".txt"):
-                with open(os.path.join("data/postings", filename), "r") as f:
-                    all_postings_text += f"\n\n--- START OF POSTING: {filename} ---\n"
-                    all_postings_text += f.read()
-                    all_postings_text += f"\n--- END OF POSTING: {filename} ---"
+                all_postings_text += f"\n\n--- START OF POSTING: {filename} ---\n"
+                all_postings_text += summarize_file("data/postings", filename, "job posting")
+                all_postings_text += f"\n--- END OF POSTING: {filename} ---"
         if not all_postings_text:
             return {"messages": [("system", "Error: No .txt files found in data/postings/")]}
     except FileNotFoundError as e:
@@ -5,6 +5,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from typing_extensions import TypedDict
 from langchain_google_genai import ChatGoogleGenerativeAI
+from .summary_agent import summarize_file
 
 # --- 1. Setup ---
 load_dotenv()
@@ -19,21 +20,20 @@ class State(TypedDict):
 # --- 3. "Tool" Function (File Reader) ---
 def get_files_for_recruiter_agent(target_posting_file: str) -> tuple[str, str, str]:
     """
-    Reads the main job posting and ALL candidate profiles.
+    Reads the main job posting and ALL candidate profiles as condensed
+    digests (the full text is only sent to the judge).
     Returns (posting_text, all_profiles_text, error_message)
     """
     try:
-        with open(os.path.join("data/postings", target_posting_file), "r") as f:
-            posting_text = f.read()
+        posting_text = summarize_file("data/postings", target_posting_file, "job posting")
 
         profile_files = os.listdir("data/profiles")
         all_profiles_text = ""
         for filename in profile_files:
             if filename.endswith(".txt"):
-                with open(os.path.join("data/profiles", filename), "r") as f:
-                    all_profiles_text += f"\n\n--- START OF PROFILE: {filename} ---\n"
-                    all_profiles_text += f.read()
-                    all_profiles_text += f"\n--- END OF PROFILE: {filename} ---"
+                all_profiles_text += f"\n\n--- START OF PROFILE: {filename} ---\n"
+                all_profiles_text += summarize_file("data/profiles", filename, "candidate profile")
+                all_profiles_text += f"\n--- END OF PROFILE: {filename} ---"
         
         if not all_profiles_text:
             return None, None, "Error: No .txt files found in data/profiles/"
@@ -0,0 +1,81 @@
+import os
+import hashlib
+from dotenv import load_dotenv
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+# --- 1. Setup ---
+load_dotenv()
+llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
+
+SUMMARIES_DIR = "data/summaries"
+
+# In-process copy of the on-disk cache, keyed by content hash
+_summary_cache = {}
+
+# --- 2. Helpers ---
+def get_content_hash(text: str) -> str:
+    """
+    Returns a stable hash of a document's text, used as the cache key.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def build_summary_prompt(text: str, kind: str) -> str:
+    """
+    Creates the prompt that condenses a posting or profile into a digest.
+    """
+    return f"""
+    You are a document summarizer for a recruiting system. Condense the following
+    {kind} into a compact, structured digest. Keep only facts that matter for
+    matching candidates with jobs and leave out everything else.
+
+    ---DOCUMENT---
+    {text}
+    ---END DOCUMENT---
+
+    Respond with ONLY these five lines, each kept short:
+    ROLE: <primary job function>
+    SENIORITY: <e.g. intern, junior, mid, senior>
+    KEY SKILLS: <comma-separated list>
+    HARD REQUIREMENTS: <must-haves, comma-separated, or 'none'>
+    LOCATION: <location or 'unspecified'>
+    """
+
+# --- 3. Summary Functions ---
+def summarize_document(text: str, kind: str) -> str:
+    """
+    Returns the condensed digest for a document, calling the LLM only
+    when this exact text has not been summarized before.
+    """
+    key = get_content_hash(f"{kind}\n{text}")
+    if key in _summary_cache:
+        return _summary_cache[key]
+
+    cache_path = os.path.join(SUMMARIES_DIR, f"{key}.txt")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            digest = f.read()
+        _summary_cache[key] = digest
+        return digest
+
+    response = llm.invoke([("human", build_summary_prompt(text, kind))])
+    digest = response.content.strip()
+    if not digest:
+        # Fall back to the full text and don't cache, so the next call retries
+        print(f"  Warning: Summarizer returned an empty digest for a {kind}. Using full text.")
+        return text
+
+    # Write to a temp file and swap it in, so other workers never read a partial digest
+    os.makedirs(SUMMARIES_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(digest)
+    os.replace(tmp_path, cache_path)
+    _summary_cache[key] = digest
+    return digest
+
+def summarize_file(directory: str, filename: str, kind: str) -> str:
+    """
+    Reads a document from disk and returns its cached digest.
+    """
+    with open(os.path.join(directory, filename), "r") as f:
+        return summarize_document(f.read(), kind)
@@ -0,0 +1,184 @@
+import os
+import json
+import argparse
+from itertools import islice
+from typing import Iterator, List, Type
+
+from agents.matcher_agent import run_full_matchmaking
+from agents.job_queue import QUEUE_PATH_ENV, SQLiteJobQueue
+from agents.documents import (
+    POSTINGS_DIR,
+    PROFILES_DIR,
+    Posting,
+    Profile,
+    clear_data_folder,
+    write_posting_file,
+    write_profile_file,
+)
+
+# =========================
+#  Input Streaming
+# =========================
+
+def read_jsonl(path: str) -> Iterator[dict]:
+    """Yields one JSON object per non-empty line without loading the whole file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def iter_batches(path: str, model: Type, batch_size: int) -> Iterator[list]:
+    """Streams postings or profiles from a JSONL file in lists of batch_size."""
+    records = (model(**record) for record in read_jsonl(path))
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def get_record_filename(record_id: int) -> str:
+    """Names data files after the record ID, since titles and names repeat in large corpora."""
+    return f"{record_id}.txt"
+
+def get_record_id(filename: str) -> int:
+    """Maps a data file written by this runner back to its record ID."""
+    return int(os.path.splitext(filename)[0])
+
+def write_posting_batch(postings: List[Posting]):
+    """Replaces the files in data/postings with one batch of postings."""
+    clear_data_folder(POSTINGS_DIR)
+    for p in postings:
+        write_posting_file(p, get_record_filename(p.ID))
+
+def write_profile_batch(profiles: List[Profile]):
+    """Replaces the files in data/profiles with one batch of profiles."""
+    clear_data_folder(PROFILES_DIR)
+    for p in profiles:
+        write_profile_file(p, get_record_filename(p.ID))
+
+# =========================
+#  Checkpointing
+# =========================
+
+def load_checkpoint(path: str) -> dict:
+    """Returns the saved progress, or a fresh one if there is none."""
+    if not os.path.exists(path):
+        return {"completed_batches": 0, "output_offset": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_checkpoint(path: str, checkpoint: dict):
+    """Writes the progress atomically so a crash never leaves a half-written file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+# =========================
+#  Batch Run
+# =========================
+
+def run_batches(postings_path: str, profiles_path: str, output_path: str, batch_size: int, profile_batch_size: int, job_queue=None, restart: bool = False):
+    """
+    Matches every posting batch against every profile batch and appends each
+    posting's merged mutual matches to output_path. Both batch sizes bound how
+    many documents a single prompt can contain. Progress is checkpointed after
+    each posting batch, so a rerun of the same command continues where the
+    last one stopped.
+    """
+    checkpoint_path = f"{output_path}.checkpoint"
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = load_checkpoint(checkpoint_path)
+
+    # Batch boundaries depend on these, so resuming is only safe when they match
+    run_settings = {
+        "batch_size": batch_size,
+        "profile_batch_size": profile_batch_size,
+        "postings": os.path.abspath(postings_path),
+        "profiles": os.path.abspath(profiles_path),
+    }
+    if checkpoint["completed_batches"]:
+        if checkpoint.get("run_settings") != run_settings:
+            raise SystemExit(
+                f"Checkpoint {checkpoint_path} was written with {checkpoint.get('run_settings')}, "
+                f"not {run_settings}. Rerun with the original arguments or pass --restart."
+            )
+        print(f"Resuming after batch {checkpoint['completed_batches']}.")
+
+    # truncate() would pad a missing or shorter file with NUL bytes instead of trimming it
+    output_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+    if output_size < checkpoint["output_offset"]:
+        raise SystemExit(
+            f"{output_path} is shorter than checkpoint {checkpoint_path} expects "
+            f"({output_size} < {checkpoint['output_offset']} bytes). Pass --restart to start over."
+        )
+
+    # Drop any lines written after the last checkpoint (e.g. a batch that crashed halfway)
+    with open(output_path, "a+", encoding="utf-8") as out:
+        out.truncate(checkpoint["output_offset"])
+
+    for batch_index, postings in enumerate(iter_batches(postings_path, Posting, batch_size)):
+        if batch_index < checkpoint["completed_batches"]:
+            continue
+
+        print(f"\n=== Batch {batch_index}: {len(postings)} postings ===")
+        write_posting_batch(postings)
+
+        # Each posting's mutual matches, merged over all profile batches
+        merged_matches = {}
+        for profile_batch_index, profiles in enumerate(iter_batches(profiles_path, Profile, profile_batch_size)):
+            print(f"\n--- Profile batch {profile_batch_index}: {len(profiles)} profiles ---")
+            write_profile_batch(profiles)
+
+            verdicts = run_full_matchmaking(job_queue)
+            if isinstance(verdicts, dict):
+                raise SystemExit(f"Batch {batch_index} failed: {verdicts.get('error')}")
+            for match in verdicts:
+                merged_matches.setdefault(match["posting_file"], set()).update(match["mutual_matches"])
+
+        with open(output_path, "a", encoding="utf-8") as out:
+            for posting_file, profile_files in merged_matches.items():
+                mutual_matches = sorted(profile_files, key=get_record_id)
+                row = {
+                    "batch": batch_index,
+                    "posting_id": get_record_id(posting_file),
+                    "profile_ids": [get_record_id(f) for f in mutual_matches],
+                    "posting_file": posting_file,
+                    "mutual_matches": mutual_matches,
+                }
+                out.write(json.dumps(row) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+            checkpoint = {
+                "completed_batches": batch_index + 1,
+                "output_offset": out.tell(),
+                "run_settings": run_settings,
+            }
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    print(f"\nBatch run complete. {checkpoint['completed_batches']} batches written to {output_path}.")
+
+# =========================
+#  Entry Point
+# =========================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run bulk matchmaking over JSONL files of postings and profiles. "
+                    "Uses the same data/ folders as the API, so never run it while the API is serving requests."
+    )
+    parser.add_argument("--postings", required=True, help="JSONL file with one posting per line.")
+    parser.add_argument("--profiles", required=True, help="JSONL file with one profile per line.")
+    parser.add_argument("--output", required=True, help="JSONL file the mutual matches are appended to.")
+    parser.add_argument("--batch-size", type=int, default=20, help="Number of postings matched per batch.")
+    parser.add_argument("--profile-batch-size", type=int, default=50, help="Number of profiles each posting batch is matched against at a time.")
+    parser.add_argument("--queue-path", default=os.getenv(QUEUE_PATH_ENV), help="SQLite queue shared with worker.py. Runs in-process if unset.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first batch.")
+    args = parser.parse_args()
+
+    job_queue = SQLiteJobQueue(args.queue_path) if args.queue_path else None
+    run_batches(args.postings, args.profiles, args.output, args.batch_size, args.profile_batch_size, job_queue, args.restart)
+
+if __name__ == "__main__":
+    main()
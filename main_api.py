@@ -1,18 +1,35 @@
 import uvicorn
 import os
+import json
+import time
+import asyncio
+import hashlib
 from fastapi import FastAPI
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Tuple
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import your matchmaking engine
 from agents.matcher_agent import run_full_matchmaking
+from agents.job_queue import get_job_queue
+from agents.documents import (
+    POSTINGS_DIR,
+    PROFILES_DIR,
+    Posting,
+    Profile,
+    clear_data_folder,
+    write_posting_file,
+    write_profile_file,
+)
 
 app = FastAPI(
     title="Full Matchmaking API",
     description="Receives live data from the frontend, runs matchmaking, and returns verdicts."
 )
 
+# Set MATCHMAKING_QUEUE_PATH to hand agent work to `worker.py` processes
+job_queue = get_job_queue()
+
 # --- Allow frontend origins (adjust if deployed) ---
 origins = ["*"]  
 
@@ -28,26 +45,6 @@ app.add_middleware(
 #  Pydantic Models (Match the Frontend)
 # =========================
 
-class Posting(BaseModel):
-    ID: int
-    title: str
-    company: str
-    location: Optional[str] = None
-    about: Optional[str] = None
-    job_description: Optional[str] = None
-    responsibilities: Optional[str] = None
-    qualifications: Optional[str] = None
-
-class Profile(BaseModel):
-    ID: int
-    Name: str
-    Profile: Optional[str] = None
-    experience: Optional[str] = None
-    education: Optional[str] = None
-    skills: Optional[str] = None
-    extracurricular: Optional[str] = None
-    preferences: Optional[str] = None
-
 class LiveMatchRequest(BaseModel):
     postings: List[Posting]
     profiles: List[Profile]
@@ -56,17 +53,11 @@ class LiveMatchRequest(BaseModel):
 #  Data File Handling
 # =========================
 
-POSTINGS_DIR = "data/postings"
-PROFILES_DIR = "data/profiles"
-
 def clear_data_folders():
     """Remove all .txt files from the data directories."""
     print("Clearing old .txt files...")
     for directory in [POSTINGS_DIR, PROFILES_DIR]:
-        os.makedirs(directory, exist_ok=True)
-        for filename in os.listdir(directory):
-            if filename.endswith(".txt"):
-                os.remove(os.path.join(directory, filename))
+        clear_data_folder(directory)
 
 def sync_live_data_to_files(postings: List[Posting], profiles: List[Profile]):
     """Write live data into local .txt files for the agent system."""
@@ -74,46 +65,55 @@ def sync_live_data_to_files(postings: List[Posting], profiles: List[Profile]):
 
     # --- Write postings ---
     for p in postings:
-        filepath = os.path.join(POSTINGS_DIR, f"{p.title}.txt")
-        content = f"""
-JOB TITLE: {p.title}
-COMPANY: {p.company}
-LOCATION: {p.location or ''}
-ABOUT US:
-{p.about or ''}
-JOB DESCRIPTION:
-{p.job_description or ''}
-RESPONSIBILITIES:
-{p.responsibilities or ''}
-QUALIFICATIONS:
-{p.qualifications or ''}
-"""
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_posting_file(p)
 
     # --- Write profiles ---
     for p in profiles:
-        filepath = os.path.join(PROFILES_DIR, f"{p.Name}.txt")
-        content = f"""
-NAME: {p.Name}
-PROFILE:
-{p.Profile or ''}
-EXPERIENCE:
-{p.experience or ''}
-EDUCATION:
-{p.education or ''}
-SKILLS:
-{p.skills or ''}
-EXTRACURRICULARS:
-{p.extracurricular or ''}
-PREFERENCES:
-{p.preferences or ''}
-"""
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_profile_file(p)
 
     print(f"Synced {len(postings)} postings and {len(profiles)} profiles.")
 
+# =========================
+#  Request Coalescing
+# =========================
+
+# How long a finished result is reused for byte-identical requests
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("MATCHMAKING_RESULT_TTL_SECONDS", "30"))
+
+# Runs share the data/ folders, so only one may sync and match at a time
+matchmaking_lock = asyncio.Lock()
+in_flight_runs: Dict[str, asyncio.Task] = {}
+result_cache: Dict[str, Tuple[float, list]] = {}
+
+def get_request_key(request: LiveMatchRequest) -> str:
+    """Hashes a canonical JSON form of the request so identical payloads share a key."""
+    payload = json.dumps(request.model_dump(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def sync_and_run_matchmaking(request: LiveMatchRequest):
+    """Saves the request data into text files and runs the matcher."""
+    sync_live_data_to_files(request.postings, request.profiles)
+
+    # Run the multi-agent matchmaking engine
+    return run_full_matchmaking(job_queue)
+
+async def run_matchmaking_once(key: str, request: LiveMatchRequest):
+    """Runs matchmaking for a request and caches the result under its key."""
+    try:
+        async with matchmaking_lock:
+            verdicts = await asyncio.to_thread(sync_and_run_matchmaking, request)
+    finally:
+        in_flight_runs.pop(key, None)
+
+    # Error dicts are not cached so the next request retries
+    if isinstance(verdicts, list):
+        now = time.monotonic()
+        for cached_key, (cached_at, _) in list(result_cache.items()):
+            if now - cached_at >= RESULT_CACHE_TTL_SECONDS:
+                del result_cache[cached_key]
+        result_cache[key] = (now, verdicts)
+    return verdicts
+
 # =========================
 #  API Endpoint
 # =========================
@@ -123,12 +123,25 @@ async def run_matchmaking_from_live_data(request: LiveMatchRequest):
     """
     Endpoint called by the React frontend.
     It receives Supabase data, saves it into text files, runs the matcher, and returns results.
+    Identical requests that arrive while a run is going share its result.
     """
     print("Received matchmaking request...")
-    sync_live_data_to_files(request.postings, request.profiles)
-
-    # Run the multi-agent matchmaking engine
-    verdicts = run_full_matchmaking()
+    key = get_request_key(request)
+
+    cached = result_cache.get(key)
+    if cached and time.monotonic() - cached[0] < RESULT_CACHE_TTL_SECONDS:
+        print("Returning cached result for identical request.")
+        return cached[1]
+
+    run = in_flight_runs.get(key)
+    if run is None:
+        run = asyncio.create_task(run_matchmaking_once(key, request))
+        in_flight_runs[key] = run
+    else:
+        print("Identical request already running. Waiting for its result...")
+
+    # Shielded so one client disconnecting doesn't cancel the run for the others
+    verdicts = await asyncio.shield(run)
 
     print("Matchmaking complete. Returning results.")
     return verdicts
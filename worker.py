@@ -0,0 +1,74 @@
+import os
+import time
+import sqlite3
+import argparse
+import traceback
+from multiprocessing import Process
+
+from agents.job_queue import QUEUE_PATH_ENV, DEFAULT_QUEUE_PATH, SQLiteJobQueue
+
+# =========================
+#  Worker Loop
+# =========================
+
+def worker_loop(worker_id: int, queue_path: str, poll_interval: float):
+    """
+    Claims matchmaking jobs from the queue and runs them until interrupted.
+    """
+    # Imported here so each worker process sets up its own LLM clients
+    from agents.matcher_agent import run_job
+
+    job_queue = SQLiteJobQueue(queue_path)
+    print(f"[Worker {worker_id}] Listening on {queue_path}")
+    try:
+        while True:
+            try:
+                job = job_queue.claim()
+            except sqlite3.OperationalError as e:
+                # e.g. "database is locked" while other processes hold the queue
+                print(f"[Worker {worker_id}] Could not claim a job ({e}). Retrying.")
+                time.sleep(poll_interval)
+                continue
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+
+            job_id, kind, payload = job
+            print(f"[Worker {worker_id}] Running {kind} job {job_id}")
+            try:
+                job_queue.complete(job_id, run_job(kind, payload))
+            except Exception:
+                job_queue.fail(job_id, traceback.format_exc())
+                print(f"[Worker {worker_id}] Job {job_id} failed.")
+    except KeyboardInterrupt:
+        print(f"[Worker {worker_id}] Stopping.")
+
+# =========================
+#  Entry Point
+# =========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Run matchmaking workers that consume the local job queue.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--queue-path", default=os.getenv(QUEUE_PATH_ENV, DEFAULT_QUEUE_PATH), help="SQLite queue file shared with the API.")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds to wait when the queue is empty.")
+    args = parser.parse_args()
+
+    # Create the queue table once before the workers start racing for it
+    SQLiteJobQueue(args.queue_path)
+
+    workers = [
+        Process(target=worker_loop, args=(i, args.queue_path, args.poll_interval))
+        for i in range(args.workers)
+    ]
+    for w in workers:
+        w.start()
+    try:
+        for w in workers:
+            w.join()
+    except KeyboardInterrupt:
+        for w in workers:
+            w.join()
+
+if __name__ == "__main__":
+    main()